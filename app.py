@@ -3,7 +3,9 @@ from streamlit_option_menu import option_menu
 import streamlit.components.v1 as components
 import os
 import sys
-import glob
+import fnmatch
+import mmap
+import re
 import time
 
 # Add Trade folder path
@@ -208,19 +210,38 @@ st.markdown("""
 # 3. Helper Functions
 # ==========================================
 
+# Files at least this big are decoded straight from a read-only memory map
+_MMAP_MIN_BYTES = 1 << 20
+
+
+def _read_text(file_path):
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Text mode would translate CRLF, so only files without '\r' take the mapped path
+                if mm.find(b'\r') == -1:
+                    return str(mm, 'utf-8')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _read_text_file(file_path, mtime):
+    # mtime is only part of the cache key: rewriting the file invalidates the entry
+    return _read_text(file_path)
+
+
 def load_weekly_analysis():
     file_path = os.path.join("WeeklyContent", "latest_analysis.md")
     if os.path.exists(file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return _read_text_file(file_path, os.path.getmtime(file_path))
     else:
         return "⚠️ Weekly analysis not uploaded yet (File not found: WeeklyContent/latest_analysis.md)"
 
 
 def load_html_file(file_path):
     if os.path.exists(file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return _read_text_file(file_path, os.path.getmtime(file_path))
     else:
         return f"<div style='padding:20px; color:red;'>⚠️ File not found: {file_path}</div>"
 
@@ -229,6 +250,10 @@ import os
 import streamlit.components.v1 as components
 
 
+def _mtime_or_none(path):
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
 def load_stock_dna_with_injection():
     # 1. Get absolute paths to ensure it works from any directory
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -239,89 +264,168 @@ def load_stock_dna_with_injection():
     if not os.path.exists(html_path):
         return f"<div style='color:red'>HTML not found: {html_path}</div>"
 
-    with open(html_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    # The CSVs are multi-MB: rebuild only when one of the three files changes
+    sig = (os.path.getmtime(html_path), _mtime_or_none(csv_factor_path), _mtime_or_none(csv_returns_path))
+    return _build_stock_dna_html(html_path, csv_factor_path, csv_returns_path, sig)
+
+
+# Backticks would close the JS template literals the CSVs are embedded in
+_BACKTICK_TABLE = str.maketrans('', '', '`')
+
+# Both Papa.parse download calls plus every 'download: true,' key, matched in one scan
+_STOCK_DNA_INJECT_RE = re.compile(r'Papa\.parse\("stock_(factor|returns)_data\.csv", \{|download: true,')
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _build_stock_dna_html(html_path, csv_factor_path, csv_returns_path, sig):
+    html_content = _read_text(html_path)
+
+    injections = {}
 
     # ---------------------------------------------------------
     # 1. Inject Factor Data (Your original logic)
     # ---------------------------------------------------------
     if os.path.exists(csv_factor_path):
-        with open(csv_factor_path, 'r', encoding='utf-8') as f:
-            csv_data = f.read()
-            # Clean up backticks just in case
-            csv_data = csv_data.replace('`', '')
+        # Clean up backticks just in case
+        csv_data = _read_text(csv_factor_path).translate(_BACKTICK_TABLE)
 
         # JS to inject: Create variable -> Parse variable -> Disable download
-        injection_js = f"""
-        var csvData = `{csv_data}`;
-        Papa.parse(csvData, {{
-            download: false, 
-        """
-
-        target_str = 'Papa.parse("stock_factor_data.csv", {'
-        if target_str in html_content:
-            html_content = html_content.replace(target_str, injection_js)
+        # Kept as fragments so the CSV is copied once, into the final join
+        injections['factor'] = (
+            "\n        var csvData = `", csv_data,
+            "`;\n        Papa.parse(csvData, {\n            download: false, \n        ",
+        )
 
     # ---------------------------------------------------------
     # 2. Inject Returns Data (The NEW addition)
     # ---------------------------------------------------------
     if os.path.exists(csv_returns_path):
-        with open(csv_returns_path, 'r', encoding='utf-8') as f:
-            returns_data = f.read()
-            returns_data = returns_data.replace('`', '')
+        returns_data = _read_text(csv_returns_path).translate(_BACKTICK_TABLE)
 
         # JS to inject: Use a DIFFERENT variable name (returnsCSVData)
-        injection_js_ret = f"""
-        var returnsCSVData = `{returns_data}`;
-        Papa.parse(returnsCSVData, {{
-            download: false, 
-        """
-
-        target_str_ret = 'Papa.parse("stock_returns_data.csv", {'
-        if target_str_ret in html_content:
-            html_content = html_content.replace(target_str_ret, injection_js_ret)
+        injections['returns'] = (
+            "\n        var returnsCSVData = `", returns_data,
+            "`;\n        Papa.parse(returnsCSVData, {\n            download: false, \n        ",
+        )
 
     # ---------------------------------------------------------
-    # 3. Global Cleanup
+    # 3. Assemble in a single pass over the HTML
     # ---------------------------------------------------------
     # Since we injected 'download: false', we remove the original 'download: true'
     # to avoid syntax errors or conflicting keys in the JS object.
-    html_content = html_content.replace('download: true,', '')
+    parts = []
+    pos = 0
+    for match in _STOCK_DNA_INJECT_RE.finditer(html_content):
+        parts.append(html_content[pos:match.start()])
+        kind = match.group(1)
+        if kind in injections:
+            parts.extend(injections[kind])
+        elif kind is not None:
+            parts.append(match.group(0))
+        pos = match.end()
+    parts.append(html_content[pos:])
 
-    return html_content
+    return ''.join(parts)
 
 
 def get_latest_file_content(folder_path, pattern="*.html"):
     if not os.path.exists(folder_path):
         return None, f"Directory not found: {folder_path}"
 
-    search_pattern = os.path.join(folder_path, pattern)
-    list_of_files = glob.glob(search_pattern)
-
-    if not list_of_files:
+    # One directory pass; DirEntry.stat() is reused for both ctime and the cache mtime
+    latest_entry = None
+    latest_stat = None
+    try:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                # glob's '*' never matches dotfiles, keep it that way
+                if entry.name.startswith('.') or not fnmatch.fnmatchcase(entry.name, pattern):
+                    continue
+                if not entry.is_file():
+                    continue
+                entry_stat = entry.stat()
+                if latest_stat is None or entry_stat.st_ctime > latest_stat.st_ctime:
+                    latest_entry, latest_stat = entry, entry_stat
+    except OSError:
+        # e.g. folder_path is a file (NotADirectoryError): glob simply matched nothing here
+        latest_entry = None
+
+    if latest_entry is None:
         return None, f"No files found matching {pattern}."
 
-    latest_file = max(list_of_files, key=os.path.getctime)
-
     try:
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            return f.read(), os.path.basename(latest_file)
+        return _read_text_file(latest_entry.path, latest_stat.st_mtime), latest_entry.name
     except Exception as e:
         return None, str(e)
 
 
+# --- Static layout blocks (shared by every rerun) ---
+@st.cache_resource
+def _menu_styles():
+    # Cached so reruns hand option_menu the same dicts instead of rebuilding them
+    main_styles = {
+        "container": {"padding": "0!important", "background-color": "transparent"},
+        "icon": {"color": "#9CA3AF", "font-size": "15px"},
+        "nav-link": {
+            "font-size": "15px", "text-align": "left", "margin": "5px",
+            "color": "#D1D5DB", "--hover-color": "#1F2937",
+        },
+        "nav-link-selected": {"background-color": "#2563EB", "color": "#FFFFFF", "font-weight": "600"},
+    }
+    submenu_styles = {
+        "container": {"padding": "0!important", "background-color": "rgba(255,255,255,0.03)",
+                      "border-radius": "10px"},
+        "nav-link": {"font-size": "14px", "margin": "3px", "--hover-color": "#374151"},
+        "nav-link-selected": {"background-color": "#4B5563"},
+    }
+    return main_styles, submenu_styles
+
+
+_MAIN_MENU_STYLES, _SUBMENU_STYLES = _menu_styles()
+
+_SIDEBAR_HEADER_HTML = """
+    <div style='padding: 20px 0px; text-align: center; border-bottom: 1px solid #374151; margin-bottom: 20px;'>
+        <h2 style='color: #F3F4F6; margin:0; letter-spacing: 1px; font-weight: 700;'>ParisTrader</h2>
+        <p style='color: #9CA3AF; font-size: 0.85em; margin-top:5px;'>Algo & Quant Research</p>
+    </div>
+    """
+
+# Injected into the Market Risk report's <head>
+_MARKET_RISK_FIX_STYLE = """
+        <style>
+            body {
+                display: block !important;
+                height: auto !important;
+                min-height: 100vh;
+                padding-top: 50px;
+                background-color: #020617 !important;
+            }
+            .card { margin: 0 auto !important; }
+        </style>
+        """
+
+_FOOTER_HTML = """
+<div class="custom-footer">
+    <p>
+        © 2026 Paris Trader. All rights reserved.<br>
+        <span style="font-size: 0.75rem; color: #6B7280;">
+        Not financial advice · For informational and educational purposes only · I am not a licensed financial advisor in Hong Kong or any jurisdiction · Investments carry risk of total loss · Paris Trader accepts no liability.
+        </span>
+    </p>
+    <p>
+        <a href="https://t.me/algoparistrader" target="_blank">@ParisTrader on TG</a>
+    </p>
+</div>
+"""
+
+
 # ==========================================
 # 4. Main App Interface (Mixed Navigation)
 # ==========================================
 
 # --- Sidebar ---
 with st.sidebar:
-    st.markdown("""
-    <div style='padding: 20px 0px; text-align: center; border-bottom: 1px solid #374151; margin-bottom: 20px;'>
-        <h2 style='color: #F3F4F6; margin:0; letter-spacing: 1px; font-weight: 700;'>ParisTrader</h2>
-        <p style='color: #9CA3AF; font-size: 0.85em; margin-top:5px;'>Algo & Quant Research</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
 
     # 4. Create Navigation Menu
     selected_nav = option_menu(
@@ -336,15 +440,7 @@ with st.sidebar:
         ],
         menu_icon="compass",
         default_index=0,
-        styles={
-            "container": {"padding": "0!important", "background-color": "transparent"},
-            "icon": {"color": "#9CA3AF", "font-size": "15px"},
-            "nav-link": {
-                "font-size": "15px", "text-align": "left", "margin": "5px",
-                "color": "#D1D5DB", "--hover-color": "#1F2937",
-            },
-            "nav-link-selected": {"background-color": "#2563EB", "color": "#FFFFFF", "font-weight": "600"},
-        }
+        styles=_MAIN_MENU_STYLES
     )
 
     # 在您的 option_menu 下方加入這段，將選單同步到網址參數
@@ -373,12 +469,7 @@ with st.sidebar:
             menu_title=None,
             options=["Market Risk", "Market Breadth", "Economic Calendar"],
             icons=["activity", "bar-chart-line", "calendar-event"],
-            styles={
-                "container": {"padding": "0!important", "background-color": "rgba(255,255,255,0.03)",
-                              "border-radius": "10px"},
-                "nav-link": {"font-size": "14px", "margin": "3px", "--hover-color": "#374151"},
-                "nav-link-selected": {"background-color": "#4B5563"},
-            }
+            styles=_SUBMENU_STYLES
         )
 
     elif selected_nav == "Stock":
@@ -391,12 +482,7 @@ with st.sidebar:
                      "Volatility Target", "Industry Sector Heatmap"],
             icons=["cash-coin", "radar", "basket", "graph-up-arrow", "people", "lightning-charge", "bullseye",
                    "grid-3x3"],
-            styles={
-                "container": {"padding": "0!important", "background-color": "rgba(255,255,255,0.03)",
-                              "border-radius": "10px"},
-                "nav-link": {"font-size": "14px", "margin": "3px", "--hover-color": "#374151"},
-                "nav-link-selected": {"background-color": "#4B5563"},
-            }
+            styles=_SUBMENU_STYLES
         )
 
     elif selected_nav == "Future":
@@ -405,12 +491,7 @@ with st.sidebar:
             menu_title=None,
             options=["Volume Profile", "Intraday Volatility", "HSI CBBC Ladder"],
             icons=["bar-chart-steps", "lightning-charge", "distribute-vertical"],
-            styles={
-                "container": {"padding": "0!important", "background-color": "rgba(255,255,255,0.03)",
-                              "border-radius": "10px"},
-                "nav-link": {"font-size": "14px", "margin": "3px", "--hover-color": "#374151"},
-                "nav-link-selected": {"background-color": "#4B5563"},
-            }
+            styles=_SUBMENU_STYLES
         )
 
     elif selected_nav == "Option":
@@ -419,12 +500,7 @@ with st.sidebar:
             menu_title=None,
             options=["US Option", "HK Option"],
             icons=["currency-dollar", "globe-asia-australia"],  # US用美元符號, HK用亞洲地球符號
-            styles={
-                "container": {"padding": "0!important", "background-color": "rgba(255,255,255,0.03)",
-                              "border-radius": "10px"},
-                "nav-link": {"font-size": "14px", "margin": "3px", "--hover-color": "#374151"},
-                "nav-link-selected": {"background-color": "#4B5563"},
-            }
+            styles=_SUBMENU_STYLES
         )
 
     elif selected_nav == "MT5 EA":
@@ -433,12 +509,7 @@ with st.sidebar:
             menu_title=None,
             options=["EA Introduction", "Daily Report"],
             icons=["robot", "file-earmark-bar-graph"],
-            styles={
-                "container": {"padding": "0!important", "background-color": "rgba(255,255,255,0.03)",
-                              "border-radius": "10px"},
-                "nav-link": {"font-size": "14px", "margin": "3px", "--hover-color": "#374151"},
-                "nav-link-selected": {"background-color": "#4B5563"},
-            }
+            styles=_SUBMENU_STYLES
         )
 
     st.markdown("---")
@@ -471,8 +542,51 @@ if target_page in locked_pages:
 
 
 # --- Content Routing (Based on target_page) ---
+# Page name -> render function, filled by @register below
+PAGE_HANDLERS = {}
+
+
+def register(page_name):
+    def decorator(func):
+        PAGE_HANDLERS[page_name] = func
+        return func
+    return decorator
+
+
+def _render_latest_report(title, path, pattern, height, caption, missing_warning, missing_info=None,
+                          subtitle=None):
+    # Shared body of every "show the newest report in a folder" page
+    if title:
+        st.title(title)
+    if subtitle:
+        st.caption(subtitle)
+
+    html_content, filename = get_latest_file_content(path, pattern)
+
+    if html_content:
+        st.caption(f"{caption}: {filename}")
+        components.html(html_content, height=height, scrolling=True)
+    else:
+        st.warning(missing_warning)
+        if missing_info:
+            st.info(missing_info)
+
+
+def _render_html_file(title, html_path, height, missing_warning, missing_info):
+    # Shared body of the pages backed by one fixed HTML file
+    if title:
+        st.title(title)
+    html_content = load_html_file(html_path)
+    if html_content and "File not found" not in html_content:
+        components.html(html_content, height=height, scrolling=True)
+    else:
+        st.warning(missing_warning)
+        st.info(missing_info)
+
+
 # [PAGE] HOME
-if target_page == "Home":
+@register("Home")
+def _page_home():
     col_main, col_profile = st.columns([0.7, 0.3], gap="large")
 
     with col_main:
@@ -571,8 +685,10 @@ if target_page == "Home":
         </div>
         """, unsafe_allow_html=True)
 
+
 # [PAGE] Market Dashboard
-elif target_page == "Market Dashboard":
+@register("Market Dashboard")
+def _page_market_dashboard():
     st.title("Market Dashboard")
     path = os.path.join("MarketDashboard", "main_auto", "output")
     html_content, filename = get_latest_file_content(path)
@@ -583,8 +699,10 @@ elif target_page == "Market Dashboard":
         st.warning("⚠️ No dashboard files found.")
         st.error(f"Error: {filename}")
 
+
 # [PAGE] Market Risk
-elif target_page == "Market Risk":
+@register("Market Risk")
+def _page_market_risk():
     st.title("⚠️ Market Implied Risk")
     path = "ImpliedParameters"
 
@@ -592,92 +710,73 @@ elif target_page == "Market Risk":
 
     if html_content:
         st.caption(f"Displaying Report: {filename}")
-        fix_style = """
-        <style>
-            body {
-                display: block !important;
-                height: auto !important;
-                min-height: 100vh;
-                padding-top: 50px;
-                background-color: #020617 !important;
-            }
-            .card { margin: 0 auto !important; }
-        </style>
-        """
-        html_content = html_content.replace("<head>", "<head>" + fix_style)
+        html_content = html_content.replace("<head>", "<head>" + _MARKET_RISK_FIX_STYLE)
         components.html(html_content, height=2200, scrolling=True)
     else:
         st.warning("⚠️ No risk reports found.")
         st.info("Please ensure `ImpliedParameters/implied_params_*.html` exists.")
 
-# [PAGE] Market Breadth
-elif target_page == "Market Breadth":
-    st.title("🌊 Market Breadth")
 
+# [PAGE] Market Breadth
+@register("Market Breadth")
+def _page_market_breadth():
     # [修正] 路徑指向新的子資料夾 MarketBreadth
     path = os.path.join("MarketDashboard", "MarketBreadth")
 
     # [修正] 自動讀取該資料夾內最新的 html 檔案 (market_breadth_*.html)
-    html_content, filename = get_latest_file_content(path, "market_breadth_*.html")
+    _render_latest_report(
+        "🌊 Market Breadth", path, "market_breadth_*.html", 2200,
+        caption="Displaying Report",
+        missing_warning="⚠️ Market Breadth report not found.",
+        missing_info=f"Please ensure `{path}` contains `market_breadth_*.html` files.",
+    )
 
-    if html_content:
-        st.caption(f"Displaying Report: {filename}")
-        components.html(html_content, height=2200, scrolling=True)
-    else:
-        st.warning("⚠️ Market Breadth report not found.")
-        st.info(f"Please ensure `{path}` contains `market_breadth_*.html` files.")
 
 # [PAGE] Economic Calendar (NEW)
-elif target_page == "Economic Calendar":
-    st.title("📅 Weekly Economic Calendar")
-
+@register("Economic Calendar")
+def _page_economic_calendar():
     # Points to EconomicCalendar folder
     #path = "EconomicCalendar"
     path = os.path.join("MarketDashboard", "EconomicCalendar")
 
     # Matches the prefix defined in the python script: calendar_report_
-    html_content, filename = get_latest_file_content(path, "calendar_report_*.html")
+    _render_latest_report(
+        "📅 Weekly Economic Calendar", path, "calendar_report_*.html", 1200,
+        caption="📅 Report Generated",
+        missing_warning="⚠️ No Economic Calendar report found.",
+        missing_info="Please run `python macro_dashboard.py` to generate the latest report.",
+    )
 
-    if html_content:
-        st.caption(f"📅 Report Generated: {filename}")
-        components.html(html_content, height=1200, scrolling=True)
-    else:
-        st.warning("⚠️ No Economic Calendar report found.")
-        st.info("Please run `python macro_dashboard.py` to generate the latest report.")
 
 # [PAGE] Industry Sector Heatmap
-elif target_page == "Industry Sector Heatmap":
-    st.title("🔥 Industry Sector Heatmap")
-    st.caption("Daily Return Heatmap (Last 20 Days)")
-
+@register("Industry Sector Heatmap")
+def _page_industry_sector_heatmap():
     path = "MarketDashboard"
     pattern = "sector_etf_heatmap_*.html"
-    html_content, filename = get_latest_file_content(path, pattern)
+    _render_latest_report(
+        "🔥 Industry Sector Heatmap", path, pattern, 1200,
+        subtitle="Daily Return Heatmap (Last 20 Days)",
+        caption="Displaying Report",
+        missing_warning="⚠️ Sector Heatmap not found.",
+        missing_info=f"Please ensure `{path}/{pattern}` exists.",
+    )
 
-    if html_content:
-        st.caption(f"Displaying Report: {filename}")
-        components.html(html_content, height=1200, scrolling=True)
-    else:
-        st.warning("⚠️ Sector Heatmap not found.")
-        st.info(f"Please ensure `{path}/{pattern}` exists.")
 
 # [PAGE] Earnings
-elif target_page == "Earnings":
-    st.title("📅 Earnings Calendar Analysis")
-
+@register("Earnings")
+def _page_earnings():
     # Use get_latest_file_content to automatically fetch the latest html
-    path = "Earnings"
-    html_content, filename = get_latest_file_content(path)
+    _render_latest_report(
+        "📅 Earnings Calendar Analysis", "Earnings", "*.html", 2500,
+        caption="Displaying Report",
+        missing_warning="⚠️ No earnings reports found.",
+        missing_info="Please ensure there is an `Earnings` folder in the root directory containing .html files.",
+    )
 
-    if html_content:
-        st.caption(f"Displaying Report: {filename}")
-        components.html(html_content, height=2500, scrolling=True)
-    else:
-        st.warning("⚠️ No earnings reports found.")
-        st.info("Please ensure there is an `Earnings` folder in the root directory containing .html files.")
 
 # [PAGE] Stock DNA
-elif target_page == "Stock DNA":
+@register("Stock DNA")
+def _page_stock_dna():
     st.title("🧬 Stock Factor DNA")
     html_content = load_stock_dna_with_injection()
     if html_content and "HTML not found" not in html_content:
@@ -686,214 +785,193 @@ elif target_page == "Stock DNA":
         st.error("FamaFrench/index.html not found")
 
 
-
 # [PAGE] Thematic Basket
-elif target_page == "Thematic Basket":
-    st.title("🧺 Thematic Basket Analysis")
+@register("Thematic Basket")
+def _page_thematic_basket():
     path = "ThematicBasket"
-    html_content, filename = get_latest_file_content(path, "elite_signal_dashboard_*.html")
+    _render_latest_report(
+        "🧺 Thematic Basket Analysis", path, "elite_signal_dashboard_*.html", 6000,
+        caption="📅 Strategy Report",
+        missing_warning="⚠️ No basket reports found.",
+        missing_info=f"Checking path: {os.path.abspath(path)}",
+    )
 
-    if html_content:
-        st.caption(f"📅 Strategy Report: {filename}")
-        components.html(html_content, height=6000, scrolling=True)
-    else:
-        st.warning("⚠️ No basket reports found.")
-        st.info(f"Checking path: {os.path.abspath(path)}")
 
 # [PAGE] ETF Smart Money
-elif target_page == "ETF Smart Money":
-    st.title("🚀 ETF Smart Money Tracker")
-    st.caption("Tracking Leveraged ETF Relative Volume Spikes")
-
+@register("ETF Smart Money")
+def _page_etf_smart_money():
     path = "xETF"
-    html_content, filename = get_latest_file_content(path, "ETF_Smart_Money_Report_*.html")
+    _render_latest_report(
+        "🚀 ETF Smart Money Tracker", path, "ETF_Smart_Money_Report_*.html", 2000,
+        subtitle="Tracking Leveraged ETF Relative Volume Spikes",
+        caption="📅 Report Date",
+        missing_warning="⚠️ No ETF Smart Money reports found.",
+        missing_info=f"Please ensure `{path}` folder exists and contains `ETF_Smart_Money_Report_*.html` files.",
+    )
 
-    if html_content:
-        st.caption(f"📅 Report Date: {filename}")
-        components.html(html_content, height=2000, scrolling=True)
-    else:
-        st.warning("⚠️ No ETF Smart Money reports found.")
-        st.info(f"Please ensure `{path}` folder exists and contains `ETF_Smart_Money_Report_*.html` files.")
 
 # [PAGE] Insider Trading
-elif target_page == "Insider Trading":
-    st.title("🕴️ Insider Trading Activity")
-    st.caption("Daily Cluster Buys & Significant Insider Transactions")
-
+@register("Insider Trading")
+def _page_insider_trading():
     path = "Insider"
-    html_content, filename = get_latest_file_content(path, "Insider_Trading_Report_*.html")
+    _render_latest_report(
+        "🕴️ Insider Trading Activity", path, "Insider_Trading_Report_*.html", 2000,
+        subtitle="Daily Cluster Buys & Significant Insider Transactions",
+        caption="📅 Report Date",
+        missing_warning="⚠️ No Insider Trading reports found.",
+        missing_info=f"Please ensure `{path}` folder exists and contains `Insider_Trading_Report_*.html` files.",
+    )
 
-    if html_content:
-        st.caption(f"📅 Report Date: {filename}")
-        components.html(html_content, height=2000, scrolling=True)
-    else:
-        st.warning("⚠️ No Insider Trading reports found.")
-        st.info(f"Please ensure `{path}` folder exists and contains `Insider_Trading_Report_*.html` files.")
 
 # [PAGE] Short Squeeze (NEW)
-elif target_page == "Short Squeeze":
-    st.title("⚡ Short Squeeze Scanner")
-    st.caption("Retail Hype & High Short Interest Candidates")
-
+@register("Short Squeeze")
+def _page_short_squeeze():
     path = "Short_squeeze"
     # Match the filename format from your Python script: Short_squeeze_YYYYMMDD_HHMMSS.html
-    html_content, filename = get_latest_file_content(path, "Short_squeeze_*.html")
-
-    if html_content:
-        st.caption(f"📅 Report Date: {filename}")
-        components.html(html_content, height=2000, scrolling=True)
-    else:
-        st.warning("⚠️ No Short Squeeze reports found.")
-        st.info(f"Please ensure `{path}` folder exists and contains `Short_squeeze_*.html` files.")
+    _render_latest_report(
+        "⚡ Short Squeeze Scanner", path, "Short_squeeze_*.html", 2000,
+        subtitle="Retail Hype & High Short Interest Candidates",
+        caption="📅 Report Date",
+        missing_warning="⚠️ No Short Squeeze reports found.",
+        missing_info=f"Please ensure `{path}` folder exists and contains `Short_squeeze_*.html` files.",
+    )
 
 
 # [PAGE] Reddit Sentiment (NEW)
-elif target_page == "Reddit Sentiment":
+@register("Reddit Sentiment")
+def _page_reddit_sentiment():
     # st.title("🤖 Reddit Sentiment Scanner")
     path = "Rddt"
     # Assuming your script outputs files like reddit_scanner_YYYY-MM-DD.html
-    html_content, filename = get_latest_file_content(path, "reddit_scanner_*.html")
+    _render_latest_report(
+        None, path, "reddit_scanner_*.html", 2000,
+        caption="📅 Report Date",
+        missing_warning="⚠️ No Reddit reports found.",
+        missing_info=f"Please ensure `{path}` folder exists and contains `reddit_scanner_*.html` files.",
+    )
 
-    if html_content:
-        st.caption(f"📅 Report Date: {filename}")
-        components.html(html_content, height=2000, scrolling=True)
-    else:
-        st.warning("⚠️ No Reddit reports found.")
-        st.info(f"Please ensure `{path}` folder exists and contains `reddit_scanner_*.html` files.")
 
 # [PAGE] Volatility Target
-elif target_page == "Volatility Target":
-    st.title("📉 Volatility Target Strategy")
-    path = "VolTarget"
-    html_content, filename = get_latest_file_content(path, "vol_tool_*.html")
+@register("Volatility Target")
+def _page_volatility_target():
+    _render_latest_report(
+        "📉 Volatility Target Strategy", "VolTarget", "vol_tool_*.html", 1500,
+        caption="Displaying Report",
+        missing_warning="⚠️ Volatility Tool not found.",
+        missing_info="Please ensure `vol_tool_*.html` exists in the `VolTarget` folder.",
+    )
 
-    if html_content:
-        st.caption(f"Displaying Report: {filename}")
-        components.html(html_content, height=1500, scrolling=True)
-    else:
-        st.warning("⚠️ Volatility Tool not found.")
-        st.info("Please ensure `vol_tool_*.html` exists in the `VolTarget` folder.")
 
 # ==========================================
 # [PAGE] US Option (原有的 Option Strike Analysis)
 # ==========================================
-elif target_page == "US Option":
-    st.title("🇺🇸 US Option Strike Analysis")
-    st.caption("Tracking Unusual Options Activity & Gamma Levels")
-
+@register("US Option")
+def _page_us_option():
     # 設定資料夾路徑
     path = "Option"
 
     # 設定 US Option 的檔案搜尋模式
     search_pattern = "option_strike_analysis_*.html"
 
-    html_content, filename = get_latest_file_content(path, search_pattern)
+    _render_latest_report(
+        "🇺🇸 US Option Strike Analysis", path, search_pattern, 2000,
+        subtitle="Tracking Unusual Options Activity & Gamma Levels",
+        caption="📅 Report Date",
+        missing_warning="⚠️ No US Option reports found.",
+        missing_info=f"Please ensure `{path}` folder exists and contains `{search_pattern}` files.",
+    )
 
-    if html_content:
-        st.caption(f"📅 Report Date: {filename}")
-        components.html(html_content, height=2000, scrolling=True)
-    else:
-        st.warning("⚠️ No US Option reports found.")
-        st.info(f"Please ensure `{path}` folder exists and contains `{search_pattern}` files.")
 
 # ==========================================
 # [PAGE] HK Option (新的 Market Analysis v6)
 # ==========================================
-elif target_page == "HK Option":
-    st.title("🇭🇰 HK Option Market Analysis")
-    st.caption("Market Scanner, Stock Ranking & Heatmaps")
-
+@register("HK Option")
+def _page_hk_option():
     # 設定資料夾路徑 (假設 HK 檔案也在 Option 資料夾內)
     path = "Option"
 
     # 設定 HK Option 的檔案搜尋模式 (v6 版本)
     search_pattern = "HK_Option_Market_Analysis_v6_*.html"
 
-    html_content, filename = get_latest_file_content(path, search_pattern)
+    _render_latest_report(
+        "🇭🇰 HK Option Market Analysis", path, search_pattern, 2000,
+        subtitle="Market Scanner, Stock Ranking & Heatmaps",
+        caption="📅 Report Date",
+        missing_warning="⚠️ No HK Option reports found.",
+        missing_info=f"Please ensure `{path}` folder exists and contains `{search_pattern}` files.",
+    )
 
-    if html_content:
-        st.caption(f"📅 Report Date: {filename}")
-        components.html(html_content, height=2000, scrolling=True)
-    else:
-        st.warning("⚠️ No HK Option reports found.")
-        st.info(f"Please ensure `{path}` folder exists and contains `{search_pattern}` files.")
 
 # [PAGE] Volume Profile
-elif target_page == "Volume Profile":
-    st.title("📊 Volume Profile Analysis")
-    path = "VP"
-    html_content, filename = get_latest_file_content(path)
+@register("Volume Profile")
+def _page_volume_profile():
+    _render_latest_report(
+        "📊 Volume Profile Analysis", "VP", "*.html", 1000,
+        caption="Displaying Report",
+        missing_warning="⚠️ 尚未部署 Volume Profile 模組 (VP 資料夾為空)",
+    )
 
-    if html_content:
-        st.caption(f"Displaying Report: {filename}")
-        components.html(html_content, height=1000, scrolling=True)
-    else:
-        st.warning("⚠️ 尚未部署 Volume Profile 模組 (VP 資料夾為空)")
 
 # [PAGE] Future -> Intraday Volatility
-elif target_page == "Intraday Volatility":
-    st.title("⚡ Intraday Volatility Analysis")
+@register("Intraday Volatility")
+def _page_intraday_volatility():
     html_path = os.path.join("MarketDashboard", "Intraday_Volatility.html")
-    html_content = load_html_file(html_path)
-    if html_content and "File not found" not in html_content:
-        components.html(html_content, height=1200, scrolling=True)
-    else:
-        st.warning("⚠️ 找不到 Intraday Volatility 報告")
-        st.info(f"請確認檔案 `{html_path}` 是否存在。")
+    _render_html_file(
+        "⚡ Intraday Volatility Analysis", html_path, 1200,
+        missing_warning="⚠️ 找不到 Intraday Volatility 報告",
+        missing_info=f"請確認檔案 `{html_path}` 是否存在。",
+    )
+
 
 # [PAGE] Future -> HSI CBBC Ladder
-elif target_page == "HSI CBBC Ladder":
-    st.title("🐻 HSI CBBC Heavy Zone (牛熊重貨區)")
+@register("HSI CBBC Ladder")
+def _page_hsi_cbbc_ladder():
     html_path = os.path.join("MarketDashboard", "HSI_CBBC_Ladder.html")
-    html_content = load_html_file(html_path)
-    if html_content and "File not found" not in html_content:
-        components.html(html_content, height=1200, scrolling=True)
-    else:
-        st.warning("⚠️ 尚未生成牛熊證分佈報告")
-        st.info(f"請確認檔案 `{html_path}` 是否存在。")
+    _render_html_file(
+        "🐻 HSI CBBC Heavy Zone (牛熊重貨區)", html_path, 1200,
+        missing_warning="⚠️ 尚未生成牛熊證分佈報告",
+        missing_info=f"請確認檔案 `{html_path}` 是否存在。",
+    )
+
 
 # [PAGE] My Trade
-elif target_page == "My Trade":
+@register("My Trade")
+def _page_my_trade():
     # st.title("💼 My Trade Journal") # Title is already inside the HTML
 
-    path = "Trade"
     # Search for files matching the timestamp pattern generated by your script
-    html_content, filename = get_latest_file_content(path, "trade_record_*.html")
+    _render_latest_report(
+        None, "Trade", "trade_record_*.html", 1200,
+        caption="📅 Report Date",
+        missing_warning="⚠️ Trade Record HTML not found.",
+        missing_info="Please verify that the GitHub Action has run successfully and generated a `trade_record_*.html` file in the `Trade` folder.",
+    )
 
-    if html_content:
-        st.caption(f"📅 Report Date: {filename}")
-        components.html(html_content, height=1200, scrolling=True)
-    else:
-        st.warning("⚠️ Trade Record HTML not found.")
-        st.info(
-            "Please verify that the GitHub Action has run successfully and generated a `trade_record_*.html` file in the `Trade` folder.")
 
 # [PAGE] MT5 EA - Introduction
-elif target_page == "EA Introduction":
-    st.title("🤖 MT5 Expert Advisor")
-    html_path = os.path.join("MT5EA", "ea_marketing.html")
-    html_content = load_html_file(html_path)
-    if html_content and "File not found" not in html_content:
-        components.html(html_content, height=3000, scrolling=True)
-    else:
-        st.warning("⚠️ No marketing content found.")
-        st.info("Please ensure `MT5EA/ea_marketing.html` exists.")
+@register("EA Introduction")
+def _page_ea_introduction():
+    _render_html_file(
+        "🤖 MT5 Expert Advisor", os.path.join("MT5EA", "ea_marketing.html"), 3000,
+        missing_warning="⚠️ No marketing content found.",
+        missing_info="Please ensure `MT5EA/ea_marketing.html` exists.",
+    )
+
 
 # [PAGE] MT5 EA - Daily Report (NEW)
-elif target_page == "Daily Report":
-    st.title("📄 Algo Daily Report")
-    path = "MT5EA"
-    html_content, filename = get_latest_file_content(path, "DailyReport_*.html")
+@register("Daily Report")
+def _page_daily_report():
+    _render_latest_report(
+        "📄 Algo Daily Report", "MT5EA", "DailyReport_*.html", 2000,
+        caption="📅 Report Date",
+        missing_warning="⚠️ No Daily Reports found.",
+        missing_info="Please ensure files named `DailyReport_*.html` exist in `MT5EA` folder.",
+    )
 
-    if html_content:
-        st.caption(f"📅 Report Date: {filename}")
-        components.html(html_content, height=2000, scrolling=True)
-    else:
-        st.warning("⚠️ No Daily Reports found.")
-        st.info("Please ensure files named `DailyReport_*.html` exist in `MT5EA` folder.")
 
 # [PAGE] LEGAL
-elif target_page == "Legal":
+@register("Legal")
+def _page_legal():
     st.title("📜 Legal & Compliance")
     tab1, tab2, tab3 = st.tabs(["Disclaimer", "Privacy Policy", "Terms of Use"])
     with tab1:
@@ -906,40 +984,35 @@ elif target_page == "Legal":
         html = load_html_file(os.path.join("Legal", "terms.html"))
         st.html(html)
 
+
 # [PAGE] Resources
-elif target_page == "Resources":
-    st.title("🔗 Trading Resources")
+@register("Resources")
+def _page_resources():
     html_path = os.path.join("Resources", "external_links.html")
-    html_content = load_html_file(html_path)
-    if html_content and "File not found" not in html_content:
-        components.html(html_content, height=1000, scrolling=True)
-    else:
-        st.warning("⚠️ Resources file not found.")
-        st.info(f"Please ensure `{html_path}` exists.")
+    _render_html_file(
+        "🔗 Trading Resources", html_path, 1000,
+        missing_warning="⚠️ Resources file not found.",
+        missing_info=f"Please ensure `{html_path}` exists.",
+    )
+
 
 # [PAGE] Promotion (NEW)
-elif target_page == "Promotion":
+@register("Promotion")
+def _page_promotion():
     html_path = os.path.join("Promotion", "promo.html")
-    html_content = load_html_file(html_path)
-    if html_content and "File not found" not in html_content:
-        components.html(html_content, height=1600, scrolling=True)
-    else:
-        st.warning("⚠️ Promotion page not found.")
-        st.info(f"Please ensure `{html_path}` exists.")
+    _render_html_file(
+        None, html_path, 1600,
+        missing_warning="⚠️ Promotion page not found.",
+        missing_info=f"Please ensure `{html_path}` exists.",
+    )
+
+
+# Dispatch; an unknown page renders nothing, as the old if/elif chain did
+_page_handler = PAGE_HANDLERS.get(target_page)
+if _page_handler:
+    _page_handler()
 
 # ==========================================
 # 5. Global Footer
 # ==========================================
-st.markdown("""
-<div class="custom-footer">
-    <p>
-        © 2026 Paris Trader. All rights reserved.<br>
-        <span style="font-size: 0.75rem; color: #6B7280;">
-        Not financial advice · For informational and educational purposes only · I am not a licensed financial advisor in Hong Kong or any jurisdiction · Investments carry risk of total loss · Paris Trader accepts no liability.
-        </span>
-    </p>
-    <p>
-        <a href="https://t.me/algoparistrader" target="_blank">@ParisTrader on TG</a>
-    </p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
\ No newline at end of file